@@ -450,6 +450,16 @@ class TacApplication(Adw.Application):
                 border: 1px solid alpha(@warning_color, 0.6);
             }
 
+            /* Project list: reveal a row's actions while it is hovered or focused */
+            .project-row .row-actions {
+                opacity: 0;
+            }
+
+            .project-row:hover .row-actions,
+            .project-row:focus-within .row-actions {
+                opacity: 1;
+            }
+
             /* Footnote badge styles */
             .footnote-badge {
                 background: @accent_bg_color;
@@ -441,11 +441,10 @@ class Project:
         Returns:
             int: Number of words
         """
-        if not content or not content.strip():
+        if not content:
             return 0
-        # Split on whitespace and filter empty strings
-        words = [word for word in content.split() if word.strip()]
-        return len(words)
+        # str.split() never yields empty or whitespace-only items
+        return len(content.split())
 
     @staticmethod
     def _count_logical_paragraphs(paragraphs: List['Paragraph']) -> int:
@@ -277,7 +277,7 @@ class ProjectManager:
             for p in project.paragraphs:
                 try:
                     formatting_json = json.dumps(p.formatting)
-                    footnotes_json = json.dumps(p.footnotes if hasattr(p, 'footnotes') else [])
+                    footnotes_json = json.dumps(p.footnotes)
                 except (TypeError, ValueError) as e:
                     print(_("Erro de serialização JSON para parágrafo {}: {}").format(p.id, e))
                     return False
@@ -708,6 +708,30 @@ class ProjectManager:
             traceback.print_exc()
             return None
 
+    def rename_project(self, project_id: str, new_name: str) -> Optional[str]:
+        """Rename a project without loading its paragraphs.
+
+        Returns the new modification timestamp, or None on failure.
+        """
+        modified_at = datetime.now().isoformat()
+        try:
+            with self._get_db_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "UPDATE projects SET name = ?, modified_at = ? WHERE id = ?",
+                    (new_name, modified_at, project_id)
+                )
+                conn.commit()
+                if cursor.rowcount == 0:
+                    print(_("Projeto com ID {} não encontrado no banco de dados.").format(project_id))
+                    return None
+
+                print(_("Projeto renomeado no banco de dados: {}").format(new_name))
+                return modified_at
+        except sqlite3.Error as e:
+            print(_("Erro de banco de dados ao renomear projeto: {}").format(e))
+            return None
+
     def delete_project(self, project_id: str) -> bool:
         """Delete project from the database"""
         try:
@@ -1107,7 +1131,7 @@ class ExportService:
         footnote_map = {}
         
         for paragraph in project.paragraphs:
-            if hasattr(paragraph, 'footnotes') and paragraph.footnotes:
+            if paragraph.footnotes:
                 paragraph_footnotes = []
                 for footnote_text in paragraph.footnotes:
                     # Check if footnote already exists
@@ -2799,7 +2823,7 @@ class ExportService:
                     
                     chunk = self._format_text_for_latex(paragraph.content)
                     
-                    if hasattr(paragraph, 'footnotes') and paragraph.footnotes:
+                    if paragraph.footnotes:
                         for note in paragraph.footnotes:
                             note_fmt = self._format_text_for_latex(note)
                             chunk += NoEscape(r'\footnote{' + note_fmt + r'}')
@@ -7,20 +7,25 @@ import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
+import functools
+import logging
 import re
+import weakref
 
-from gi.repository import Gtk, Adw, GObject, Gdk, GLib, Gio, Pango, Graphene
+from gi.repository import Gtk, Adw, GObject, Gdk, GLib, Gio, Pango
 from datetime import datetime
 
-from core.models import Paragraph, ParagraphType, DEFAULT_TEMPLATES
+from core.models import Paragraph, ParagraphType
 from core.services import ProjectManager
 from utils.helpers import TextHelper, FormatHelper
 from utils.i18n import _
 
+logger = logging.getLogger(__name__)
+
 _CURRENT_DRAG_ID = None
 
 # Try to load enchant for spell checking (GTK4-native)
-import os, sys
+import os
 
 # Help pyenchant find the enchant C library on MSYS2/MINGW
 if 'PYENCHANT_LIBRARY_PATH' not in os.environ:
@@ -29,44 +34,98 @@ if 'PYENCHANT_LIBRARY_PATH' not in os.environ:
         _dll_path = os.path.join(_mingw_prefix, 'bin', _dll_name)
         if os.path.exists(_dll_path):
             os.environ['PYENCHANT_LIBRARY_PATH'] = _dll_path
-            print(f"Enchant DLL found: {_dll_path}", flush=True)
+            logger.debug("Enchant DLL found: %s", _dll_path)
             break
 
 try:
     import enchant
     SPELL_CHECK_AVAILABLE = True
-    _enchant_broker = enchant.Broker()
-    _enchant_dicts = [d[0] for d in _enchant_broker.list_dicts()]
-    print(f"Enchant available - dictionaries: {_enchant_dicts}", flush=True)
-    if not _enchant_dicts:
-        print("WARNING: No dictionaries found! Install hunspell dictionaries.", flush=True)
 except ImportError as e:
     SPELL_CHECK_AVAILABLE = False
-    print(f"Enchant not available - spell checking disabled: {e}", flush=True)
+    logger.warning("Enchant not available - spell checking disabled: %s", e)
     
     
-_css_cache = {}
+# Characters that can't appear in a CSS class name as-is (including "_",
+# which is used as the escape marker so distinct fonts never collide)
+_CLASS_SANITIZE = re.compile(r'[^A-Za-z0-9-]')
+
+
+def _css_class_fragment(text: str) -> str:
+    """Escape text into a collision-free CSS class name fragment"""
+    return _CLASS_SANITIZE.sub(lambda m: f'_{ord(m.group()):x}_', text)
 
+
+@functools.lru_cache(maxsize=None)
 def get_cached_css_provider(font_family: str, font_size: int) -> dict:
     """Get or create cached CSS provider"""
-    key = f"{font_family}_{font_size}"
-    
-    if key not in _css_cache:
-        css_provider = Gtk.CssProvider()
-        class_name = f'paragraph-text-view-{key.replace(" ", "_").replace("\'", "")}'
-        css = f"""
-        .{class_name} {{
-            font-family: '{font_family}';
-            font-size: {font_size}pt;
-        }}
-        """
-        css_provider.load_from_data(css, -1)
-        _css_cache[key] = {
-            'provider': css_provider,
-            'class_name': class_name
+    css_provider = Gtk.CssProvider()
+    class_name = f'paragraph-text-view-{_css_class_fragment(f"{font_family}-{font_size}")}'
+    quoted_family = font_family.replace('\\', '\\\\').replace("'", "\\'")
+    css = f"""
+    .{class_name} {{
+        font-family: '{quoted_family}';
+        font-size: {font_size}pt;
+    }}
+    """
+    css_provider.load_from_data(css, -1)
+    return {
+        'provider': css_provider,
+        'class_name': class_name
+    }
+
+
+_formatted_date_cache = {}
+
+def _format_modified_date(modified_iso: str) -> str:
+    """Format an ISO modification timestamp for display, reusing cached results"""
+    key = (modified_iso, 'short')
+    formatted = _formatted_date_cache.get(key)
+    if formatted is None:
+        # Every save produces a new timestamp; keep the cache from growing forever
+        if len(_formatted_date_cache) >= 512:
+            _formatted_date_cache.clear()
+        modified_dt = datetime.fromisoformat(modified_iso)
+        formatted = FormatHelper.format_datetime(modified_dt, 'short')
+        _formatted_date_cache[key] = formatted
+    return formatted
+
+
+_formatted_stats_cache = {}
+
+def _format_stats(stats_key: tuple) -> str:
+    """Format a (words, paragraphs) pair for display, reusing cached results"""
+    formatted = _formatted_stats_cache.get(stats_key)
+    if formatted is None:
+        # Word counts change while editing; keep the cache from growing forever
+        if len(_formatted_stats_cache) >= 512:
+            _formatted_stats_cache.clear()
+        formatted = FormatHelper.format_project_stats(*stats_key)
+        _formatted_stats_cache[stats_key] = formatted
+    return formatted
+
+
+_TYPE_LABELS = None
+
+def _get_type_labels() -> dict:
+    """Get display labels for paragraph types, built once on first use"""
+    global _TYPE_LABELS
+    if _TYPE_LABELS is None:
+        # Keyed by the enum's string value: str hashes are cached, while
+        # hashing an Enum member goes through Enum.__hash__
+        _TYPE_LABELS = {
+            ParagraphType.TITLE_1.value: _("Título 1"),
+            ParagraphType.TITLE_2.value: _("Título 2"),
+            ParagraphType.EPIGRAPH.value: _("Epígrafe"),
+            ParagraphType.INTRODUCTION.value: _("Introdução"),
+            ParagraphType.ARGUMENT.value: _("Argumento"),
+            ParagraphType.ARGUMENT_RESUMPTION.value: _("Retomada do Argumento"),
+            ParagraphType.QUOTE.value: _("Citação"),
+            ParagraphType.CONCLUSION.value: _("Conclusão"),
+            ParagraphType.LATEX.value: _("Equação LaTeX"),
+            ParagraphType.CODE.value: _("Bloco de Código")
         }
-    
-    return _css_cache[key]
+    return _TYPE_LABELS
+
 
 class Gtk4SpellChecker:
     """
@@ -76,8 +135,14 @@ class Gtk4SpellChecker:
 
     WORD_RE = re.compile(r'[a-zA-ZÀ-öø-ÿĀ-ž]+')
 
+    # Loaded dictionaries by requested language, shared by all checkers:
+    # language -> (enchant.Dict or None, language actually loaded)
+    _dict_cache = {}
+
     def __init__(self, text_view, language='pt_BR'):
-        self.text_view = text_view
+        # Weak, so SpellCheckHelper.spell_checkers (whose values are checkers)
+        # does not keep its TextView keys alive
+        self._text_view_ref = weakref.ref(text_view)
         self.buffer = text_view.get_buffer()
         self.language = language
         self._enabled = True
@@ -94,6 +159,10 @@ class Gtk4SpellChecker:
         # Initial check after widget settles
         GLib.idle_add(self._check_spelling)
 
+    @property
+    def text_view(self):
+        return self._text_view_ref()
+
     # --- enabled property (compatible with old API) ---
     @property
     def enabled(self):
@@ -109,11 +178,19 @@ class Gtk4SpellChecker:
 
     # --- Initialization ---
     def _init_dictionary(self, language):
+        """Load the dictionary for language, reusing one already loaded"""
+        cached = Gtk4SpellChecker._dict_cache.get(language)
+        if cached is None:
+            cached = self._load_dictionary(language)
+            Gtk4SpellChecker._dict_cache[language] = cached
+        self._dict, self.language = cached
+
+    def _load_dictionary(self, language):
         """Try to load dictionary with fallbacks"""
         try:
-            self._dict = enchant.Dict(language)
-            print(f"Spell check: using '{language}' dictionary", flush=True)
-            return
+            enchant_dict = enchant.Dict(language)
+            logger.debug("Spell check: using '%s' dictionary", language)
+            return enchant_dict, language
         except enchant.errors.DictNotFoundError:
             pass
 
@@ -129,14 +206,14 @@ class Gtk4SpellChecker:
 
         for alt in alternatives:
             try:
-                self._dict = enchant.Dict(alt)
-                self.language = alt
-                print(f"Spell check: using fallback '{alt}' dictionary", flush=True)
-                return
+                enchant_dict = enchant.Dict(alt)
+                logger.debug("Spell check: using fallback '%s' dictionary", alt)
+                return enchant_dict, alt
             except enchant.errors.DictNotFoundError:
                 continue
 
-        print(f"Spell check: no dictionary found for '{language}'", flush=True)
+        logger.warning("Spell check: no dictionary found for '%s'", language)
+        return None, language
 
     def _create_tag(self):
         """Create the red wavy underline tag for misspelled words"""
@@ -351,6 +428,10 @@ class PomodoroTimer(GObject.Object):
         # Current remaining time
         self.time_remaining = self.work_duration
 
+        # Session info for the (is_work_time, current_session) it was built for
+        self._session_info_key = None
+        self._session_info = None
+
     def start_timer(self):
         """Start the timer"""
         if not self.is_running:
@@ -378,7 +459,8 @@ class PomodoroTimer(GObject.Object):
         if self.timer_id:
             GLib.source_remove(self.timer_id)
         
-        self.timer_id = GLib.timeout_add(1000, self._countdown_tick)
+        # Second-granularity source so GLib can batch wakeups with other timers
+        self.timer_id = GLib.timeout_add_seconds(1, self._countdown_tick)
 
     def _countdown_tick(self):
         """Execute every second of countdown"""
@@ -427,32 +509,110 @@ class PomodoroTimer(GObject.Object):
 
     def get_time_string(self):
         """Return formatted time as MM:SS string"""
-        minutes = self.time_remaining // 60
-        seconds = self.time_remaining % 60
+        minutes, seconds = divmod(self.time_remaining, 60)
         return f"{minutes:02d}:{seconds:02d}"
 
     def get_session_info(self):
         """Return current session information"""
+        # Only rebuilt (and re-translated) when the session actually changes
+        key = (self.is_work_time, self.current_session)
+        if key == self._session_info_key:
+            return self._session_info
+
         if self.is_work_time:
-            return {
+            info = {
                 'title': _("Sessão {}").format(self.current_session),
                 'type': 'work',
                 'session': self.current_session
             }
         else:
             if self.current_session >= self.max_sessions:
-                return {
+                info = {
                     'title': _("Pausa Longa"),
                     'type': 'long_break',
                     'session': self.current_session
                 }
             else:
-                return {
+                info = {
                     'title': _("Tempo de Descanso"),
                     'type': 'short_break',
                     'session': self.current_session
                 }
 
+        self._session_info_key = key
+        self._session_info = info
+        return info
+
+
+_POMODORO_CSS = """
+    .timer-display {
+        font-size: 72px;
+        font-weight: bold;
+        font-family: 'SF Mono', 'Monaco', 'Inconsolata', 'Fira Code', monospace;
+        color: @accent_color;
+    }
+    
+    .header-area {
+        background: transparent;
+    }
+    
+    .timer-container {
+        background: alpha(@accent_color, 0.1);
+        border-radius: 20px;
+        padding: 20px;
+        box-shadow: inset 0 1px 2px rgba(0,0,0,0.05);
+    }
+    
+    button.pill {
+        border-radius: 25px;
+        font-weight: 600;
+        font-size: 16px;
+        transition: all 0.2s ease;
+    }
+    
+    button.pill:hover {
+        transform: translateY(-1px);
+        box-shadow: 0 4px 8px rgba(0,0,0,0.15);
+    }
+    
+    button.pill:active {
+        transform: translateY(0);
+        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    }
+    
+    button.circular {
+        border-radius: 15px;
+        min-width: 34px;
+        min-height: 34px;
+        max-width: 34px;
+        max-height: 34px;
+        padding: 0;
+    }
+    
+    button.circular:hover {
+        background: alpha(@accent_color, 0.1);
+    }
+"""
+_POMODORO_CSS_INSTALLED = False
+
+def _install_pomodoro_css_once():
+    """Add the Pomodoro dialog styles to the display the first time they are needed"""
+    global _POMODORO_CSS_INSTALLED
+    if _POMODORO_CSS_INSTALLED:
+        return
+
+    try:
+        css_provider = Gtk.CssProvider()
+        css_provider.load_from_data(_POMODORO_CSS, -1)
+        Gtk.StyleContext.add_provider_for_display(
+            Gdk.Display.get_default(),
+            css_provider,
+            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+        )
+        _POMODORO_CSS_INSTALLED = True
+    except Exception as e:
+        logger.warning("Error setting up Pomodoro styles: %s", e)
+
 
 class PomodoroDialog(Adw.Window):
     """Pomodoro timer dialog with enhanced design"""
@@ -468,10 +628,19 @@ class PomodoroDialog(Adw.Window):
         self.timer = timer
         self.parent_window = parent
         
-        # Connect timer signals
-        self.timer.connect('timer-tick', self._on_timer_tick)
-        self.timer.connect('timer-finished', self._on_timer_finished)
-        self.timer.connect('session-changed', self._on_session_changed)
+        # Last texts shown, to skip redundant label updates
+        self._last_time_str = ''
+        self._last_session_title = ''
+        
+        # Finish animation timer, so it can be cancelled
+        self._blink_id = 0
+        
+        # Connect timer signals (the timer outlives this dialog)
+        self._timer_handler_ids = [
+            self.timer.connect('timer-tick', self._on_timer_tick),
+            self.timer.connect('timer-finished', self._on_timer_finished),
+            self.timer.connect('session-changed', self._on_session_changed),
+        ]
         
         self._setup_ui()
         self._setup_styles()
@@ -479,6 +648,13 @@ class PomodoroDialog(Adw.Window):
         
         # Connect close signal
         self.connect('close-request', self._on_close_request)
+        self.connect('destroy', self._disconnect_timer)
+    
+    def _disconnect_timer(self, *args):
+        """Stop listening to the shared timer"""
+        for handler_id in self._timer_handler_ids:
+            self.timer.disconnect(handler_id)
+        self._timer_handler_ids = []
     
     def _setup_ui(self):
         """Setup user interface with improved design"""
@@ -571,89 +747,36 @@ class PomodoroDialog(Adw.Window):
     
     def _setup_styles(self):
         """Setup custom CSS styles"""
-        try:
-            css_provider = Gtk.CssProvider()
-            css_data = """
-            .timer-display {
-                font-size: 72px;
-                font-weight: bold;
-                font-family: 'SF Mono', 'Monaco', 'Inconsolata', 'Fira Code', monospace;
-                color: @accent_color;
-                text-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            }
-            
-            .header-area {
-                background: transparent;
-            }
-            
-            .timer-container {
-                background: alpha(@accent_color, 0.1);
-                border-radius: 20px;
-                padding: 20px;
-                box-shadow: inset 0 1px 2px rgba(0,0,0,0.05);
-            }
-            
-            button.pill {
-                border-radius: 25px;
-                font-weight: 600;
-                font-size: 16px;
-                transition: all 0.2s ease;
-            }
-            
-            button.pill:hover {
-                transform: translateY(-1px);
-                box-shadow: 0 4px 8px rgba(0,0,0,0.15);
-            }
-            
-            button.pill:active {
-                transform: translateY(0);
-                box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            }
-            
-            button.circular {
-                border-radius: 15px;
-                min-width: 34px;
-                min-height: 34px;
-                max-width: 34px;
-                max-height: 34px;
-                padding: 0;
-            }
-            
-            button.circular:hover {
-                background: alpha(@accent_color, 0.1);
-            }
-            """
-            
-            css_provider.load_from_data(css_data, -1)
-            Gtk.StyleContext.add_provider_for_display(
-                Gdk.Display.get_default(),
-                css_provider,
-                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-            )
-        except Exception as e:
-            print(_("Erro ao configurar estilos do Pomodoro: {}").format(e))
+        _install_pomodoro_css_once()
+    
+    def _set_time_text(self, time_str):
+        """Set time label text only when it actually changed"""
+        if time_str != self._last_time_str:
+            self.time_label.set_text(time_str)
+            self._last_time_str = time_str
+    
+    def _set_session_text(self, title):
+        """Set session label text only when it actually changed"""
+        if title != self._last_session_title:
+            self.session_label.set_text(title)
+            self._last_session_title = title
     
     def _update_display(self):
         """Update dialog display with current timer information"""
         session_info = self.timer.get_session_info()
         time_str = self.timer.get_time_string()
         
-        self.session_label.set_text(session_info['title'])
-        self.time_label.set_text(time_str)
+        self._set_session_text(session_info['title'])
+        self._set_time_text(time_str)
     
     def _force_display_update(self):
         """Force complete display update"""
         session_info = self.timer.get_session_info()
         time_str = self.timer.get_time_string()
         
-        # Update labels directly
-        self.session_label.set_text(session_info['title'])
-        self.time_label.set_text(time_str)
-        
-        # Force interface redraw
-        self.session_label.queue_draw()
-        self.time_label.queue_draw()
-        self.queue_draw()
+        # set_text already queues the redraw of a label that changed
+        self._set_session_text(session_info['title'])
+        self._set_time_text(time_str)
         
         return False
     
@@ -670,19 +793,28 @@ class PomodoroDialog(Adw.Window):
     
     def _on_timer_tick(self, timer, time_remaining):
         """Update only time during execution"""
+        # While minimized the labels are refreshed by show_dialog instead
+        if not self.get_visible():
+            return
         if time_remaining > 0:
-            time_str = self.timer.get_time_string()
-            self.time_label.set_text(time_str)
+            # Format from the emitted value instead of querying the timer
+            minutes, seconds = divmod(time_remaining, 60)
+            self._set_time_text(f"{minutes:02d}:{seconds:02d}")
     
     def _on_timer_finished(self, timer, timer_type):
         """Handle timer finished - show window again"""
-        GLib.idle_add(self._force_display_update)
+        # _show_timer_finished refreshes the labels and buttons itself
         GLib.idle_add(self._show_timer_finished, timer_type)
     
     def _on_session_changed(self, timer, session, session_type):
         """Handle session change"""
-        GLib.idle_add(self._force_display_update)
-        GLib.idle_add(self._update_buttons)
+        GLib.idle_add(self._refresh_all)
+    
+    def _refresh_all(self):
+        """Refresh labels and buttons in a single idle callback"""
+        self._force_display_update()
+        self._update_buttons()
+        return False
     
     def _show_timer_finished(self, timer_type):
         """Show window when timer finishes"""
@@ -699,18 +831,31 @@ class PomodoroDialog(Adw.Window):
     
     def _add_finish_animation(self):
         """Add visual effect when timer finishes"""
-        def blink_effect(count=0):
-            if count < 6:
-                if count % 2 == 0:
-                    self.time_label.add_css_class('accent')
-                else:
-                    self.time_label.remove_css_class('accent')
-                
-                GLib.timeout_add(300, lambda: blink_effect(count + 1))
+        self._stop_finish_animation()
+        self._blink_count = 0
+        self.time_label.add_css_class('accent')
+        self._blink_id = GLib.timeout_add(300, self._blink_step)
+    
+    def _blink_step(self):
+        """Toggle the accent class on each tick of the finish animation"""
+        self._blink_count += 1
+        if self._blink_count < 6:
+            if self._blink_count % 2 == 0:
+                self.time_label.add_css_class('accent')
             else:
                 self.time_label.remove_css_class('accent')
+            return True
         
-        blink_effect()
+        self._blink_id = 0
+        self.time_label.remove_css_class('accent')
+        return False
+    
+    def _stop_finish_animation(self):
+        """Cancel a running finish animation"""
+        if self._blink_id:
+            GLib.source_remove(self._blink_id)
+            self._blink_id = 0
+            self.time_label.remove_css_class('accent')
     
     def _on_start_stop_clicked(self, button):
         """Handle Start/Stop button"""
@@ -723,16 +868,19 @@ class PomodoroDialog(Adw.Window):
     
     def _on_reset_clicked(self, button):
         """Handle Reset button"""
+        self._stop_finish_animation()
         self.timer.reset_timer()
         self._force_display_update()
         self._update_buttons()
     
     def _on_minimize_clicked(self, button):
         """Handle Minimize button"""
+        self._stop_finish_animation()
         self.set_visible(False)
     
     def _on_close_request(self, window):
         """Handle window close"""
+        self._stop_finish_animation()
         self.set_visible(False)
         return True
     
@@ -743,30 +891,49 @@ class PomodoroDialog(Adw.Window):
         self.present()
 
 
+# Languages don't change while the app runs, so they are probed only once
+_AVAILABLE_LANGS = None
+
+def _compute_available_langs() -> list:
+    """Probe enchant for the supported spell check languages"""
+    available = []
+    try:
+        # One broker for all probes; listed tags answer most of them directly
+        broker = enchant.Broker()
+        listed = {d[0] for d in broker.list_dicts()}
+        candidates = ['pt_BR', 'pt-BR', 'pt', 'en_US', 'en-US', 'en', 'es_ES', 'es']
+        for lang in candidates:
+            try:
+                if lang in listed or broker.dict_exists(lang):
+                    available.append(lang)
+            except Exception:
+                pass
+        logger.debug("Spell check languages available: %s", available)
+        if not available:
+            logger.warning("No dictionaries found! Install hunspell dictionaries.")
+    except Exception as e:
+        logger.warning("Error loading spell check languages: %s", e)
+    return available
+
+
 class SpellCheckHelper:
     """Helper class for spell checking using Gtk4SpellChecker + enchant"""
 
     def __init__(self, config=None):
         self.config = config
         self.available_languages = []
-        self.spell_checkers = {}
+        # Keyed by the TextView itself so entries go away with the widget
+        self.spell_checkers = weakref.WeakKeyDictionary()
         self._load_available_languages()
 
     def _load_available_languages(self):
         """Load available spell check languages"""
+        global _AVAILABLE_LANGS
         if not SPELL_CHECK_AVAILABLE:
             return
-        try:
-            candidates = ['pt_BR', 'pt-BR', 'pt', 'en_US', 'en-US', 'en', 'es_ES', 'es']
-            for lang in candidates:
-                try:
-                    if enchant.dict_exists(lang):
-                        self.available_languages.append(lang)
-                except Exception:
-                    pass
-            print(f"Spell check languages available: {self.available_languages}", flush=True)
-        except Exception as e:
-            print(f"Error loading spell check languages: {e}", flush=True)
+        if _AVAILABLE_LANGS is None:
+            _AVAILABLE_LANGS = _compute_available_langs()
+        self.available_languages = list(_AVAILABLE_LANGS)
 
     def setup_spell_check(self, text_view, language=None):
         """Setup spell checking for a GTK4 TextView"""
@@ -783,20 +950,21 @@ class SpellCheckHelper:
             checker = Gtk4SpellChecker(text_view, language=target_lang)
 
             if checker._dict:
-                self.spell_checkers[id(text_view)] = checker
-                print(f"Spell checker attached to widget {id(text_view)}, lang: {checker.language}", flush=True)
+                self.spell_checkers[text_view] = checker
+                logger.debug("Spell checker attached to widget %s, lang: %s", id(text_view), checker.language)
                 return checker
             else:
-                print("Spell checker: no dictionary loaded, skipping.", flush=True)
+                logger.debug("Spell checker: no dictionary loaded, skipping.")
                 return None
         except Exception as e:
-            print(f"Spell check setup failed: {e}", flush=True)
+            logger.warning("Spell check setup failed: %s", e)
             return None
 
     def enable_spell_check(self, text_view, enabled=True):
         """Enable or disable spell checking for a TextView"""
-        checker = self.spell_checkers.get(id(text_view))
-        if checker:
+        checker = self.spell_checkers.get(text_view)
+        # Toggling rescans or clears the whole buffer, so skip no-op calls
+        if checker and checker.enabled != enabled:
             checker.enabled = enabled
 
 
@@ -805,6 +973,9 @@ class WelcomeView(Gtk.Box):
 
     __gtype_name__ = 'TacWelcomeView'
 
+    # Shared launcher for the wiki link, created on first click
+    _wiki_launcher = None
+
     __gsignals__ = {
         'create-project': (GObject.SIGNAL_RUN_FIRST, None, (str,)),
         'open-project': (GObject.SIGNAL_RUN_FIRST, None, (object,)),
@@ -936,8 +1107,9 @@ class WelcomeView(Gtk.Box):
         
         try:
             # Try Gtk.UriLauncher (GTK 4.10+)
-            launcher = Gtk.UriLauncher.new(uri=wiki_url)
-            launcher.launch(self.get_root(), None, None)
+            if WelcomeView._wiki_launcher is None:
+                WelcomeView._wiki_launcher = Gtk.UriLauncher.new(uri=wiki_url)
+            WelcomeView._wiki_launcher.launch(self.get_root(), None, None)
         except AttributeError:
             # Fallback
             try:
@@ -968,6 +1140,19 @@ class ProjectListWidget(Gtk.Box):
         self.project_manager = project_manager
         self.set_vexpand(True)
 
+        # Lowercased search text, computed once per search change
+        self._search_lower = ''
+        self._filter_timeout_id = 0
+
+        # Lowercased "name\0description" per project, indexed by row._proj_idx
+        self._haystacks = []
+
+        # Per-project visibility for the current search (None shows all)
+        self._visible_mask = None
+
+        # Project rows by project id, for in-place updates
+        self._rows_by_id = {}
+
         # Search entry
         self.search_entry = Gtk.SearchEntry()
         self.search_entry.set_placeholder_text(_("Pesquisar projetos..."))
@@ -976,7 +1161,8 @@ class ProjectListWidget(Gtk.Box):
         self.search_entry.set_margin_bottom(5)
         self.search_entry.set_margin_start(25)
         self.search_entry.set_margin_end(25)
-        self.search_entry.connect('search-changed', self._on_search_changed)
+        self.search_entry.connect('changed', self._on_search_changed)
+        self.search_entry.connect('activate', self._on_search_activate)
         self.append(self.search_entry)
 
         # Scrolled window for project list
@@ -996,42 +1182,98 @@ class ProjectListWidget(Gtk.Box):
         # Load projects
         self.refresh_projects()
 
+        self.connect('destroy', self._cancel_pending_filter)
+
+    def _cancel_pending_filter(self, *args):
+        """Drop a debounced filter run that has not fired yet"""
+        if self._filter_timeout_id:
+            GLib.source_remove(self._filter_timeout_id)
+            self._filter_timeout_id = 0
+
     def refresh_projects(self):
         """Refresh the project list"""
-        # Clear existing projects
-        child = self.project_list.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.project_list.remove(child)
-            child = next_child
+        # Clear existing projects (remove_all needs GTK 4.12)
+        self._rows_by_id.clear()
+        if hasattr(self.project_list, 'remove_all'):
+            self.project_list.remove_all()
+        else:
+            child = self.project_list.get_first_child()
+            while child:
+                next_child = child.get_next_sibling()
+                self.project_list.remove(child)
+                child = next_child
 
         # Load projects
         projects = self.project_manager.list_projects()
-
-        for project_info in projects:
+        # The NUL separator keeps matches from spanning name and description
+        self._haystacks = [(p.get('name', '') + '\0' + p.get('description', '')).lower()
+                           for p in projects]
+        self._visible_mask = self._compute_visible_mask(self._search_lower)
+
+        # Filter all rows once at the end instead of on every append
+        self.project_list.set_filter_func(None)
+        for index, project_info in enumerate(projects):
             row = self._create_project_row(project_info)
+            row._proj_idx = index
+            self._rows_by_id[project_info['id']] = row
             self.project_list.append(row)
-            
+        self.project_list.set_filter_func(self._filter_projects)
+
     def update_project_statistics(self, project_id: str, stats: dict):
         """Update statistics for a specific project without full refresh"""
-        child = self.project_list.get_first_child()
-        while child:
-            if hasattr(child, 'project_info') and child.project_info['id'] == project_id:
-                # Update the project info
-                child.project_info['statistics'] = stats
-                
-                # Update the stats label if it exists
-                if hasattr(child, 'stats_label'):
-                    words = stats.get('total_words', 0)
-                    paragraphs = stats.get('total_paragraphs', 0)
-                    stats_text = FormatHelper.format_project_stats(words, paragraphs)
-                    child.stats_label.set_text(stats_text)
-                break
-            child = child.get_next_sibling()
+        row = self._rows_by_id.get(project_id)
+        if row is None:
+            return
+
+        # Update the project info
+        row.project_info['statistics'] = stats
+
+        # Update the stats label if it exists
+        if row.stats_label is not None:
+            stats_key = (stats.get('total_words', 0), stats.get('total_paragraphs', 0))
+            if stats_key != row._stats_key:
+                row.stats_label.set_text(_format_stats(stats_key))
+                row._stats_key = stats_key
+
+    def update_project_modified(self, project_id: str, modified_iso: str):
+        """Update the modification date of a specific project in place"""
+        row = self._rows_by_id.get(project_id)
+        if row is None:
+            return
+
+        row.project_info['modified_at'] = modified_iso
+        if row.date_label is not None and modified_iso != row._last_modified_iso:
+            try:
+                row.date_label.set_text(_format_modified_date(modified_iso))
+                row._last_modified_iso = modified_iso
+            except (ValueError, TypeError):
+                pass
+
+    def _apply_rename(self, project_id: str, new_name: str, modified_iso: str):
+        """Show a renamed project without reloading the whole list"""
+        row = self._rows_by_id.get(project_id)
+        if row is None:
+            self.refresh_projects()
+            return
+
+        project_info = row.project_info
+        project_info['name'] = new_name
+        row.name_label.set_text(new_name)
+        self._haystacks[row._proj_idx] = (new_name + '\0' + project_info.get('description', '')).lower()
+        self.update_project_modified(project_id, modified_iso)
+
+        # The list is sorted by modification time, so the project moves to the top
+        self.project_list.remove(row)
+        self.project_list.prepend(row)
+
+        if self._search_lower:
+            self._visible_mask = self._compute_visible_mask(self._search_lower)
+            self.project_list.invalidate_filter()
 
     def _create_project_row(self, project_info):
         """Create a row for a project"""
         row = Gtk.ListBoxRow()
+        row.add_css_class("project-row")
         row.project_info = project_info
 
         # Main box
@@ -1047,19 +1289,18 @@ class ProjectListWidget(Gtk.Box):
         # Project name
         name_label = Gtk.Label()
         name_label.set_text(project_info['name'])
-        name_label.set_halign(Gtk.Align.START)
+        name_label.set_xalign(0)
+        # Expanding the label pushes the actions and date to the right
+        # without a separate spacer widget
+        name_label.set_hexpand(True)
         name_label.set_ellipsize(3)
         name_label.add_css_class("heading")
         header_box.append(name_label)
+        row.name_label = name_label
 
-        # Spacer
-        spacer = Gtk.Box()
-        spacer.set_hexpand(True)
-        header_box.append(spacer)
-
-        # Action buttons (initially hidden)
+        # Action buttons (shown on hover by the .project-row CSS)
         actions_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
-        actions_box.set_visible(False)
+        actions_box.add_css_class("row-actions")
 
         # Edit button
         edit_button = Gtk.Button()
@@ -1067,7 +1308,7 @@ class ProjectListWidget(Gtk.Box):
         edit_button.set_tooltip_text(_("Renomear projeto"))
         edit_button.add_css_class("flat")
         edit_button.add_css_class("circular")
-        edit_button.connect('clicked', lambda b: self._on_edit_project(project_info))
+        edit_button.connect('clicked', self._on_edit_button_clicked)
         actions_box.append(edit_button)
 
         # Delete button
@@ -1076,33 +1317,37 @@ class ProjectListWidget(Gtk.Box):
         delete_button.set_tooltip_text(_("Excluir projeto"))
         delete_button.add_css_class("flat")
         delete_button.add_css_class("circular")
-        delete_button.connect('clicked', lambda b: self._on_delete_project(project_info))
+        delete_button.connect('clicked', self._on_delete_button_clicked)
         actions_box.append(delete_button)
 
         header_box.append(actions_box)
 
         # Modification date
+        row.date_label = None
+        row._last_modified_iso = None
         if project_info.get('modified_at'):
             try:
-                modified_dt = datetime.fromisoformat(project_info['modified_at'])
+                formatted_date = _format_modified_date(project_info['modified_at'])
                 date_label = Gtk.Label()
-                date_label.set_text(FormatHelper.format_datetime(modified_dt, 'short'))
+                date_label.set_text(formatted_date)
                 date_label.add_css_class("caption")
                 date_label.add_css_class("dim-label")
                 header_box.append(date_label)
+                row.date_label = date_label
+                row._last_modified_iso = project_info['modified_at']
             except (ValueError, TypeError):
                 pass
 
         box.append(header_box)
 
         # Statistics
+        row.stats_label = None
+        row._stats_key = None
         stats = project_info.get('statistics', {})
         if stats:
             stats_label = Gtk.Label()
-            words = stats.get('total_words', 0)
-            paragraphs = stats.get('total_paragraphs', 0)
-            stats_text = FormatHelper.format_project_stats(words, paragraphs)
-            stats_label.set_text(stats_text)
+            stats_key = (stats.get('total_words', 0), stats.get('total_paragraphs', 0))
+            stats_label.set_text(_format_stats(stats_key))
             stats_label.set_halign(Gtk.Align.START)
             stats_label.add_css_class("caption")
             stats_label.add_css_class("dim-label")
@@ -1110,37 +1355,79 @@ class ProjectListWidget(Gtk.Box):
             
             # Store reference to stats label for easy updating
             row.stats_label = stats_label
-
-        # Setup hover effect
-        hover_controller = Gtk.EventControllerMotion()
-        hover_controller.connect('enter', lambda c, x, y: actions_box.set_visible(True))
-        hover_controller.connect('leave', lambda c: actions_box.set_visible(False))
-        row.add_controller(hover_controller)
+            row._stats_key = stats_key
 
         row.set_child(box)
         return row
 
+    def _on_edit_button_clicked(self, button):
+        """Rename the project of the row holding this button"""
+        row = button.get_ancestor(Gtk.ListBoxRow)
+        if row:
+            self._on_edit_project(row.project_info)
+
+    def _on_delete_button_clicked(self, button):
+        """Delete the project of the row holding this button"""
+        row = button.get_ancestor(Gtk.ListBoxRow)
+        if row:
+            self._on_delete_project(row.project_info)
+
     def _on_project_activated(self, listbox, row):
         """Handle project activation"""
-        if row and hasattr(row, 'project_info'):
+        if row:
             self.emit('project-selected', row.project_info)
 
     def _on_search_changed(self, search_entry):
-        """Handle search text change"""
-        self.project_list.invalidate_filter()
+        """Handle search text change, coalescing bursts of keystrokes"""
+        self._cancel_pending_filter()
+        self._filter_timeout_id = GLib.timeout_add(150, self._do_filter)
+
+    def _on_search_activate(self, search_entry):
+        """Apply the filter right away when Enter is pressed"""
+        self._cancel_pending_filter()
+        self._do_filter()
+
+    def _do_filter(self):
+        """Refilter the project list with the current search text"""
+        self._filter_timeout_id = 0
+        search_text = self.search_entry.get_text().lower()
+
+        # Typing and deleting within one debounce window changes nothing
+        if search_text == self._search_lower:
+            return GLib.SOURCE_REMOVE
+
+        # When the search only grows, rows hidden before stay hidden
+        if self._search_lower and search_text.startswith(self._search_lower):
+            previous_mask = self._visible_mask
+        else:
+            previous_mask = None
+
+        old_mask = self._visible_mask
+        self._search_lower = search_text
+        self._visible_mask = self._compute_visible_mask(search_text, previous_mask)
+
+        # Re-running the filter is only needed when some row changes visibility
+        if self._visible_mask != old_mask:
+            self.project_list.invalidate_filter()
+        return GLib.SOURCE_REMOVE
+
+    def _compute_visible_mask(self, search_text, previous_mask=None):
+        """Match every project against the search text in a single pass"""
+        if not search_text:
+            return None
+
+        if previous_mask is not None:
+            return [visible and search_text in haystack
+                    for visible, haystack in zip(previous_mask, self._haystacks)]
+        return [search_text in haystack for haystack in self._haystacks]
 
     def _filter_projects(self, row):
         """Filter projects based on search text"""
-        search_text = self.search_entry.get_text().lower()
-        if not search_text:
+        if self._visible_mask is None:
             return True
 
-        if hasattr(row, 'project_info'):
-            project_name = row.project_info.get('name', '').lower()
-            project_desc = row.project_info.get('description', '').lower()
-            return search_text in project_name or search_text in project_desc
-
-        return True
+        # Every row is appended by refresh_projects, which sets _proj_idx
+        return self._visible_mask[row._proj_idx]
 
     def _on_edit_project(self, project_info):
         """Handle project rename"""
@@ -1156,11 +1443,9 @@ class ProjectListWidget(Gtk.Box):
         def do_rename(dlg):
             new_name = entry.get_text().strip()
             if new_name and new_name != project_info['name']:
-                project = self.project_manager.load_project(project_info['id'])
-                if project:
-                    project.name = new_name
-                    self.project_manager.save_project(project)
-                    self.refresh_projects()
+                modified_iso = self.project_manager.rename_project(project_info['id'], new_name)
+                if modified_iso:
+                    self._apply_rename(project_info['id'], new_name, modified_iso)
                     self.emit('project-renamed', project_info['id'], new_name)
 
         if hasattr(Adw, 'AlertDialog'):
@@ -1251,6 +1536,61 @@ class ProjectListWidget(Gtk.Box):
             dialog.present()
 
 
+# Splits stored paragraph content into <b>, </b>, <i>, </i>, <u>, </u> and text
+_TAG_SPLIT_RE = re.compile(r'(</?[biu]>)')
+
+# Formatting tags as bits, so a set of active tags is a single int
+_BOLD, _ITALIC, _UNDERLINE = 1, 2, 4
+_TAG_BITS = {'bold': _BOLD, 'italic': _ITALIC, 'underline': _UNDERLINE}
+
+# Stored tags always nest bold > italic > underline; these give the markers
+# that open, or close, every tag in a mask in that order
+_STORAGE_TAG_ORDER = (_BOLD, _ITALIC, _UNDERLINE)
+_STORAGE_OPEN = {_BOLD: '<b>', _ITALIC: '<i>', _UNDERLINE: '<u>'}
+_STORAGE_CLOSE = {_BOLD: '</b>', _ITALIC: '</i>', _UNDERLINE: '</u>'}
+_OPEN_BY_MASK = tuple(
+    ''.join(_STORAGE_OPEN[bit] for bit in _STORAGE_TAG_ORDER if mask & bit)
+    for mask in range(8)
+)
+_CLOSE_BY_MASK = tuple(
+    ''.join(_STORAGE_CLOSE[bit] for bit in reversed(_STORAGE_TAG_ORDER) if mask & bit)
+    for mask in range(8)
+)
+
+# Tag names for each of the 8 possible masks
+_TAG_NAMES_BY_MASK = tuple(
+    tuple(name for name, bit in _TAG_BITS.items() if mask & bit)
+    for mask in range(8)
+)
+
+# Storage tag token -> (tag bit, whether it opens the tag)
+_TAG_ACTIONS = {
+    '<b>': (_BOLD, True), '</b>': (_BOLD, False),
+    '<i>': (_ITALIC, True), '</i>': (_ITALIC, False),
+    '<u>': (_UNDERLINE, True), '</u>': (_UNDERLINE, False),
+}
+
+_LATEX_VIEW_CSS = """
+.latex-view {
+    font-family: 'Monospace';
+    background-color: alpha(@theme_fg_color, 0.05);
+    border-radius: 4px;
+    padding: 6px;
+}
+"""
+
+_CODE_VIEW_CSS = """
+.code-view {
+    font-family: 'Monospace';
+    background-color: #f3f3f3;
+    color: #2e3436;
+    border: 1px solid alpha(#000000, 0.1);
+    border-radius: 4px;
+    padding: 8px;
+}
+"""
+
+
 class ParagraphEditor(Gtk.Box):
     """Editor for individual paragraphs"""
 
@@ -1264,6 +1604,17 @@ class ParagraphEditor(Gtk.Box):
         'insert-after-requested': (GObject.SIGNAL_RUN_FIRST, None, (str, str)),
     }
 
+    # Keys of the CSS providers already on the display: (font_family, font_size)
+    # pairs and the names of the static LaTeX/code view styles
+    _installed_providers = set()
+
+    # Main window's spell helper, looked up once and shared by all editors
+    _shared_spell_helper = None
+
+    # Type menus by action name; the actions resolve against each editor's
+    # own 'para' group, so one model serves every editor
+    _type_menus = {}
+
     def __init__(self, paragraph: Paragraph, config=None, **kwargs):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, **kwargs)
         self.paragraph = paragraph
@@ -1271,6 +1622,7 @@ class ParagraphEditor(Gtk.Box):
         self.text_view = None
         self.text_buffer = None
         self.is_dragging = False
+        self._drag_paintable = None
 
         self.drag_start_x = 0
         self.drag_start_y = 0
@@ -1280,8 +1632,26 @@ class ParagraphEditor(Gtk.Box):
         self.spell_helper = None
         self._spell_check_setup = False
         
-        # Footnote badge reference
+        # Footnote badge reference and the count it currently shows
         self.footnote_badge = None
+        self._badge_count = None
+        
+        # Text edits are pushed to the model in batches; the word count is
+        # kept up to date from the inserted/deleted text only
+        self._flush_id = 0
+        self._word_count = 0
+        # Created by _create_header; the count it currently shows
+        self.word_count_label = None
+        self._shown_word_count = None
+        
+        # Last state pushed by _apply_formatting, to skip redundant work on re-map
+        self._last_text_fmt = None
+        self._last_margins = None
+        self._format_tag = None
+        self._format_tag_stale = True
+        
+        # Font CSS class currently on the text view
+        self._font_css_class = None
         
         self.set_spacing(8)
         self.add_css_class("card")
@@ -1299,6 +1669,7 @@ class ParagraphEditor(Gtk.Box):
         
         # Use 'map' instead of 'realize'
         self.connect('map', self._on_map)
+        self.connect('destroy', self.cancel_pending)
 
     def _on_map(self, widget):
         """Called when widget is mapped to screen (visible)"""
@@ -1311,19 +1682,7 @@ class ParagraphEditor(Gtk.Box):
                 font_size = formatting.get('font_size', 11)
                 
                 # Add specific visual style
-                css_provider = Gtk.CssProvider()
-                css = """
-                .latex-view {
-                    font-family: 'Monospace';
-                    background-color: alpha(@theme_fg_color, 0.05);
-                    border-radius: 4px;
-                    padding: 6px;
-                }
-                """
-                css_provider.load_from_data(css, -1)
-                self.text_view.get_style_context().add_provider(
-                    css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-                )
+                self._install_view_css('latex-view', _LATEX_VIEW_CSS)
                 self.text_view.add_css_class("latex-view")
                 
             # Logic for Code Block
@@ -1332,22 +1691,7 @@ class ParagraphEditor(Gtk.Box):
                 font_size = formatting.get('font_size', 10)
                 
                 # Add specific visual style for Code
-                css_provider = Gtk.CssProvider()
-                css = """
-                .code-view {
-                    font-family: 'Monospace';
-                    background-color: #f3f3f3;
-                    color: #2e3436;
-                    border: 1px solid alpha(#000000, 0.1);
-                    border-radius: 4px;
-                    padding: 8px;
-                }
-                """
-
-                css_provider.load_from_data(css, -1)
-                self.text_view.get_style_context().add_provider(
-                    css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-                )
+                self._install_view_css('code-view', _CODE_VIEW_CSS)
                 self.text_view.add_css_class("code-view")
 
             else:
@@ -1357,50 +1701,68 @@ class ParagraphEditor(Gtk.Box):
 
             # Use CSS cache instead of creating individual provider
             css_cache = get_cached_css_provider(font_family, font_size)
-            self.text_view.add_css_class(css_cache['class_name'])
-
-            # CORREÇÃO: Aplica o CSS de forma segura, evitando bugs de interface em múltiplas fontes
-            if not css_cache.get('applied', False):
-                display = Gdk.Display.get_default()
-                if display:
-                    Gtk.StyleContext.add_provider_for_display(
-                        display,
-                        css_cache['provider'],
-                        Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-                    )
-                css_cache['applied'] = True
+            class_name = css_cache['class_name']
+            if class_name != self._font_css_class:
+                # Swap classes so an old font rule can't win over the new one
+                if self._font_css_class:
+                    self.text_view.remove_css_class(self._font_css_class)
+                self.text_view.add_css_class(class_name)
+                self._font_css_class = class_name
+
+                # Install each font provider on the display only once
+                font_key = (font_family, font_size)
+                if font_key not in ParagraphEditor._installed_providers:
+                    display = Gdk.Display.get_default()
+                    if display:
+                        Gtk.StyleContext.add_provider_for_display(
+                            display,
+                            css_cache['provider'],
+                            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+                        )
+                        ParagraphEditor._installed_providers.add(font_key)
 
             self._apply_formatting()
             
         except Exception as e:
-            print(f"Error during paragraph editor initialization: {e}", flush=True)
+            logger.warning("Error during paragraph editor initialization: %s", e)
 
 
+    @staticmethod
+    def _install_view_css(key, css):
+        """Add a static text view stylesheet to the display once"""
+        if key in ParagraphEditor._installed_providers:
+            return
+        display = Gdk.Display.get_default()
+        if display:
+            css_provider = Gtk.CssProvider()
+            css_provider.load_from_data(css, -1)
+            Gtk.StyleContext.add_provider_for_display(
+                display, css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+            )
+            ParagraphEditor._installed_providers.add(key)
+
     def _setup_spell_check(self):
         """Setup spell check once when text view is ready"""
         # If LATEX or CODE disable spellcheck
         if self.paragraph.type in [ParagraphType.LATEX, ParagraphType.CODE]:
             return False
-        # DEBUG: Call tracking
-        print(f"DEBUG: Tentando setup spell check para {self.paragraph.id[:8]}...", flush=True)
+        logger.debug("Setting up spell check for paragraph %s", self.paragraph.id[:8])
 
         if self._spell_check_setup or not self.text_view:
             return False # Retorna False para parar o timeout
         
-        print(f"DEBUG: self.config = {self.config}", flush=True)
-        print(f"DEBUG: self.config type = {type(self.config)}", flush=True)
-        if self.config:
-            print(f"DEBUG: spell_check_enabled = {self.config.get_spell_check_enabled()}", flush=True)
         if not self.config or not self.config.get_spell_check_enabled():
-            print("DEBUG: Spell check desabilitado na config ou config ausente.", flush=True)
-        
+            logger.debug("Spell check disabled in config or config missing")
             return False
         
         try:
             # Try to get the helper from the main window, otherwise it will create a new one
-            root = self.get_root()
-            if root and hasattr(root, 'spell_helper'):
-                self.spell_helper = root.spell_helper
+            if ParagraphEditor._shared_spell_helper is None:
+                root = self.get_root()
+                if root and getattr(root, 'spell_helper', None):
+                    ParagraphEditor._shared_spell_helper = root.spell_helper
+            if ParagraphEditor._shared_spell_helper is not None:
+                self.spell_helper = ParagraphEditor._shared_spell_helper
             else:
                 if not hasattr(self, 'local_spell_helper'):
                     self.local_spell_helper = SpellCheckHelper(self.config)
@@ -1412,9 +1774,7 @@ class ParagraphEditor(Gtk.Box):
                 self._spell_check_setup = True
             
         except Exception as e:
-            print(f"Spell check setup failed: {e}", flush=True)
-            import traceback
-            traceback.print_exc()
+            logger.warning("Spell check setup failed: %s", e, exc_info=True)
             
         return False
 
@@ -1448,8 +1808,7 @@ class ParagraphEditor(Gtk.Box):
         self.type_menu_button.set_halign(Gtk.Align.START)
 
         if self.paragraph.type not in Paragraph._STRUCTURED_TYPES:
-            change_type_menu = self._build_type_menu('para.change_type')
-            self.type_menu_button.set_menu_model(change_type_menu)
+            self.type_menu_button.set_create_popup_func(self._create_type_popup, 'para.change_type')
         else:
             self.type_menu_button.set_sensitive(False)
 
@@ -1539,8 +1898,7 @@ class ParagraphEditor(Gtk.Box):
         insert_button.set_icon_name('tac-list-add-symbolic')
         insert_button.set_tooltip_text(_("Inserir novo parágrafo após este"))
         insert_button.add_css_class("flat")
-        insert_menu = self._build_type_menu('para.insert_after')
-        insert_button.set_menu_model(insert_menu)
+        insert_button.set_create_popup_func(self._create_type_popup, 'para.insert_after')
         header_box.append(insert_button)
 
         # Remove button
@@ -1583,7 +1941,7 @@ class ParagraphEditor(Gtk.Box):
             self.text_buffer.apply_tag_by_name(tag_name, start, end)
 
         # Forces update for saving tags <b>, <i>, etc.
-        self._on_text_changed(self.text_buffer)
+        self._queue_content_changed()
 
     def _on_spell_check_toggled(self, button):
         """Handle spell check toggle"""
@@ -1602,27 +1960,25 @@ class ParagraphEditor(Gtk.Box):
             try:
                 self.spell_helper.enable_spell_check(self.text_view, enabled)
             except Exception as e:
-                print(_("Erro ao alternar verificação ortográfica: {}").format(e))
+                logger.warning("Error toggling spell check: %s", e)
 
     def _create_text_editor(self):
         """Create the text editing area"""
         # Text buffer
         self.text_buffer = Gtk.TextBuffer()
 
-        # Define Formatting Tags
-        tag_table = self.text_buffer.get_tag_table()
-        if not tag_table.lookup('bold'):
-            self.text_buffer.create_tag('bold', weight=Pango.Weight.BOLD)
-        if not tag_table.lookup('italic'):
-            self.text_buffer.create_tag('italic', style=Pango.Style.ITALIC)
-        if not tag_table.lookup('underline'):
-            self.text_buffer.create_tag('underline', underline=Pango.Underline.SINGLE)
-        # ------------------------------
+        # Define Formatting Tags (the new buffer's table is always empty)
+        self.text_buffer.create_tag('bold', weight=Pango.Weight.BOLD)
+        self.text_buffer.create_tag('italic', style=Pango.Style.ITALIC)
+        self.text_buffer.create_tag('underline', underline=Pango.Underline.SINGLE)
 
         # Use new method for formatting text
         self._set_content_from_storage(self.paragraph.content)
 
         # Connect signal AFTER loading text
+        self._word_count = TextHelper.count_words(self.get_plain_text())
+        self.text_buffer.connect('insert-text', self._on_insert_text)
+        self.text_buffer.connect('delete-range', self._on_delete_range)
         self.text_buffer.connect('changed', self._on_text_changed)
 
         # Text view
@@ -1708,35 +2064,50 @@ class ParagraphEditor(Gtk.Box):
         if start_iter.equal(end_iter):
             return ""
 
+        # Fetch the text once and slice segments out of it by offset.
+        # get_slice keeps a U+FFFC placeholder for each embedded object, so
+        # buffer offsets line up with string indices; get_text would drop them
+        full_text = self.text_buffer.get_slice(start_iter, end_iter, True)
+
         output = []
+        # Formatting tags currently open in the output
+        open_mask = 0
+        # Formatting tags covering the current segment, kept up to date
+        # from the tags that toggle at each segment boundary
+        active = 0
         current_iter = start_iter
+        current_offset = 0
         
         while not current_iter.is_end():
+            for tag in current_iter.get_toggled_tags(False):
+                active &= ~_TAG_BITS.get(tag.props.name, 0)
+            for tag in current_iter.get_toggled_tags(True):
+                active |= _TAG_BITS.get(tag.props.name, 0)
+
             # Find the next point where tags change or the end of text
             next_iter = current_iter.copy()
             if not next_iter.forward_to_tag_toggle(None):
                 next_iter = end_iter
 
             # Get the text from this segment
-            text_segment = self.text_buffer.get_text(current_iter, next_iter, False)
-            
-            # Check which tags are active at the beginning of this segment
-            tags = current_iter.get_tags()
-            tag_names = [t.get_property('name') for t in tags]
+            next_offset = next_iter.get_offset()
+            # Placeholders were never part of the stored text
+            text_segment = full_text[current_offset:next_offset].replace('\ufffc', '')
             
-            # Apply opening tags
-            if 'bold' in tag_names: output.append('<b>')
-            if 'italic' in tag_names: output.append('<i>')
-            if 'underline' in tag_names: output.append('<u>')
+            changed = open_mask ^ active
+            if changed:
+                # Reopen from the outermost changed tag inwards, so the
+                # output stays properly nested for the exporters
+                inner = ~((changed & -changed) - 1)
+                output.append(_CLOSE_BY_MASK[open_mask & inner])
+                output.append(_OPEN_BY_MASK[active & inner])
+                open_mask = active
             
             output.append(text_segment)
-            
-            # Aplicar tags de fechamento (na ordem inversa)
-            if 'underline' in tag_names: output.append('</u>')
-            if 'italic' in tag_names: output.append('</i>')
-            if 'bold' in tag_names: output.append('</b>')
-            
             current_iter = next_iter
+            current_offset = next_offset
+
+        output.append(_CLOSE_BY_MASK[open_mask])
 
         return "".join(output)
 
@@ -1753,66 +2124,49 @@ class ParagraphEditor(Gtk.Box):
         if not html_content:
             return
 
+        # Plain paragraphs carry no tags at all
+        if '<' not in html_content:
+            self.text_buffer.insert(self.text_buffer.get_end_iter(), html_content)
+            return
+
         # Regex to separate tags from text
-        # Capture <b>, </b>, <i>, </i>, <u>, </u>
-        parts = re.split(r'(</?[biu]>)', html_content)
+        parts = _TAG_SPLIT_RE.split(html_content)
         
-        active_tags = set()
+        active_mask = 0
+        # Text waiting to be inserted with the tags it was read under;
+        # neighbouring parts with the same tags go into the buffer together
+        pending_text = []
+        pending_mask = 0
         
         for part in parts:
             if not part:
                 continue
                 
-            if part == '<b>':
-                active_tags.add('bold')
-            elif part == '</b>':
-                active_tags.discard('bold')
-            elif part == '<i>':
-                active_tags.add('italic')
-            elif part == '</i>':
-                active_tags.discard('italic')
-            elif part == '<u>':
-                active_tags.add('underline')
-            elif part == '</u>':
-                active_tags.discard('underline')
-            else:
-                iter_loc = self.text_buffer.get_end_iter()
-                
-                if active_tags:
-                    # Native GTK method: inserts and applies tags at once
-                    self.text_buffer.insert_with_tags_by_name(iter_loc, part, *list(active_tags))
+            action = _TAG_ACTIONS.get(part)
+            if action is not None:
+                if action[1]:
+                    active_mask |= action[0]
                 else:
-                    self.text_buffer.insert(iter_loc, part)
-
-    def _setup_dnd_styles(self):
-        """Setup specific Drag and Drop visual styles (Efeito Kanri - Margens)"""
-        css_provider = Gtk.CssProvider()
-        
-        # Using margin instead of border
-        css = """
-        .drop-target-top {
-            margin-top: 60px;
-            transition: margin 0.15s ease-out;
-            background-image: linear-gradient(to bottom, @accent_color 2px, transparent 2px);
-        }
-        
-        .drop-target-bottom {
-            margin-bottom: 60px;
-            transition: margin 0.15s ease-out;
-            background-image: linear-gradient(to top, @accent_color 2px, transparent 2px);
-        }
-        
-        .dragging {
-            opacity: 0.15;
-        }
-        """
-        try:
-            css_provider.load_from_data(css, -1)
-            self.get_style_context().add_provider(
-                css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-            )
-        except Exception as e:
-            print(f"Erro ao carregar estilos DnD: {e}")
+                    active_mask &= ~action[0]
+            else:
+                if pending_text and active_mask != pending_mask:
+                    self._insert_stored_run(''.join(pending_text), pending_mask)
+                    pending_text = []
+                pending_mask = active_mask
+                pending_text.append(part)
+
+        if pending_text:
+            self._insert_stored_run(''.join(pending_text), pending_mask)
+
+    def _insert_stored_run(self, text, tag_mask):
+        """Append a run of stored text carrying the given formatting tags"""
+        iter_loc = self.text_buffer.get_end_iter()
+        tag_names = _TAG_NAMES_BY_MASK[tag_mask]
+        if tag_names:
+            # Native GTK method: inserts and applies tags at once
+            self.text_buffer.insert_with_tags_by_name(iter_loc, text, *tag_names)
+        else:
+            self.text_buffer.insert(iter_loc, text)
 
     def _setup_drag_and_drop(self):
         """Setup drag and drop functionality using Global State for stability"""
@@ -1825,10 +2179,8 @@ class ParagraphEditor(Gtk.Box):
         drag_source.connect('drag-begin', self._on_drag_begin)
         drag_source.connect('drag-end', self._on_drag_end)
         
-        if hasattr(self, 'drag_handle'):
-            self.drag_handle.add_controller(drag_source)
-        else:
-            self.add_controller(drag_source)
+        # _create_header has already made the handle
+        self.drag_handle.add_controller(drag_source)
 
     def _on_drag_prepare(self, drag_source, x, y):
         """Prepare drag - Set global state and return dummy content"""
@@ -1846,20 +2198,21 @@ class ParagraphEditor(Gtk.Box):
         self.is_dragging = True
         self.add_css_class("dragging")
         
-        if hasattr(self, 'drag_handle'):
-            self.drag_handle.set_cursor(Gdk.Cursor.new_from_name("grabbing", None))
+        self.drag_handle.set_cursor(Gdk.Cursor.new_from_name("grabbing", None))
 
         try:
-            paintable = Gtk.WidgetPaintable.new(self)
+            # The paintable follows the widget's live rendering, so one is enough
+            if self._drag_paintable is None:
+                self._drag_paintable = Gtk.WidgetPaintable.new(self)
             
             # Try "grab" middle card
             icon_x = self.get_width() // 2
             icon_y = 20 # Top card
             
-            drag_source.set_icon(paintable, icon_x, icon_y)
+            drag_source.set_icon(self._drag_paintable, icon_x, icon_y)
                 
         except Exception as e:
-            print(f"Erro no drag icon: {e}")
+            logger.warning("Error setting drag icon: %s", e)
 
     def _on_drag_end(self, drag_source, drag, delete_data):
         """End drag operation - Clear global state"""
@@ -1870,24 +2223,12 @@ class ParagraphEditor(Gtk.Box):
         # Clears the global variable
         _CURRENT_DRAG_ID = None
         
-        if hasattr(self, 'drag_handle'):
-            self.drag_handle.set_cursor(Gdk.Cursor.new_from_name("grab", None))
+        self.drag_handle.set_cursor(Gdk.Cursor.new_from_name("grab", None))
 
     def _get_type_label(self) -> str:
         """Get display label for paragraph type"""
-        type_labels = {
-            ParagraphType.TITLE_1: _("Título 1"),
-            ParagraphType.TITLE_2: _("Título 2"),
-            ParagraphType.EPIGRAPH: _("Epígrafe"),
-            ParagraphType.INTRODUCTION: _("Introdução"),
-            ParagraphType.ARGUMENT: _("Argumento"),
-            ParagraphType.ARGUMENT_RESUMPTION: _("Retomada do Argumento"),
-            ParagraphType.QUOTE: _("Citação"),
-            ParagraphType.CONCLUSION: _("Conclusão"),
-            ParagraphType.LATEX: _("Equação LaTeX"),
-            ParagraphType.CODE: _("Bloco de Código")
-        }
-        return type_labels.get(self.paragraph.type, _("Parágrafo"))
+        label = _get_type_labels().get(self.paragraph.type.value)
+        return label if label is not None else _("Parágrafo")
 
     def _setup_paragraph_actions(self):
         """Setup action group for paragraph-level operations (type change, insert)"""
@@ -1903,8 +2244,17 @@ class ParagraphEditor(Gtk.Box):
 
         self.insert_action_group('para', action_group)
 
+    def _create_type_popup(self, menu_button, action_name):
+        """Give a type menu button its menu the first time it opens"""
+        if menu_button.get_menu_model() is None:
+            menu_button.set_menu_model(self._build_type_menu(action_name))
+
     def _build_type_menu(self, action_name):
         """Build a Gio.Menu listing all text-based paragraph types"""
+        menu = ParagraphEditor._type_menus.get(action_name)
+        if menu is not None:
+            return menu
+
         menu = Gio.Menu()
         for label, ptype in [
             (_("Título 1"), ParagraphType.TITLE_1),
@@ -1919,6 +2269,7 @@ class ParagraphEditor(Gtk.Box):
             (_("Bloco de Código"), ParagraphType.CODE),
         ]:
             menu.append(label, f"{action_name}('{ptype.value}')")
+        ParagraphEditor._type_menus[action_name] = menu
         return menu
 
     def _on_change_type_activated(self, action, param):
@@ -1937,72 +2288,140 @@ class ParagraphEditor(Gtk.Box):
             return
     
         formatting = self.paragraph.formatting
+        self._apply_text_tag_formatting(formatting)
+        self._apply_margin_formatting(formatting)
 
-        # Create text tags
-        tag_table = self.text_buffer.get_tag_table()
-
-        # Usar um nome de tag único para garantir isolamento total
-        tag_name = f"base_format_{id(self)}"
-        
-        existing_tag = tag_table.lookup(tag_name)
-        if existing_tag:
-            tag_table.remove(existing_tag)
+    def _apply_text_tag_formatting(self, formatting):
+        """Apply weight, style and underline through the base format tag"""
+        is_quote_epigraph = self.paragraph.type in [ParagraphType.QUOTE, ParagraphType.EPIGRAPH]
+        is_title = self.paragraph.type in [ParagraphType.TITLE_1, ParagraphType.TITLE_2]
+        text_fmt = (is_title or formatting.get('bold', False),
+                    is_quote_epigraph,
+                    formatting.get('underline', False))
+        if text_fmt == self._last_text_fmt and not self._format_tag_stale:
+            return
 
-        # Create new formatting tag
-        format_tag = self.text_buffer.create_tag(tag_name)
-        # PRIORIDADE 0 para permitir que os botões de negrito/itálico do usuário funcionem por cima
-        format_tag.set_priority(0)
+        # Reuse the tag and only update its properties
+        format_tag = self._format_tag
+        if format_tag is None:
+            # Usar um nome de tag único para garantir isolamento total
+            format_tag = self.text_buffer.create_tag(f"base_format_{id(self)}")
+            # PRIORIDADE 0 para permitir que os botões de negrito/itálico do usuário funcionem por cima
+            format_tag.set_priority(0)
+            self._format_tag = format_tag
 
         # -- PROTEÇÃO CONTRA VAZAMENTO --
-        is_quote_epigraph = self.paragraph.type in [ParagraphType.QUOTE, ParagraphType.EPIGRAPH]
-        is_title = self.paragraph.type in [ParagraphType.TITLE_1, ParagraphType.TITLE_2]
-        
+        # Only touch the properties that changed; each set re-lays out the tagged text
+        last_fmt = self._last_text_fmt or (None, None, None)
+
         # Weight (Negrito)
-        if is_title or formatting.get('bold', False):
-            format_tag.set_property("weight", Pango.Weight.BOLD)
-        else:
-            format_tag.set_property("weight", Pango.Weight.NORMAL)
+        if text_fmt[0] != last_fmt[0]:
+            format_tag.set_property("weight", Pango.Weight.BOLD if text_fmt[0] else Pango.Weight.NORMAL)
 
         # Style (Itálico)
-        if is_quote_epigraph:
-            format_tag.set_property("style", Pango.Style.ITALIC)
-        else:
-            format_tag.set_property("style", Pango.Style.NORMAL)
+        if text_fmt[1] != last_fmt[1]:
+            format_tag.set_property("style", Pango.Style.ITALIC if text_fmt[1] else Pango.Style.NORMAL)
             
         # Underline
-        if formatting.get('underline', False):
-            format_tag.set_property("underline", Pango.Underline.SINGLE)
-        else:
-            format_tag.set_property("underline", Pango.Underline.NONE)
+        if text_fmt[2] != last_fmt[2]:
+            format_tag.set_property("underline", Pango.Underline.SINGLE if text_fmt[2] else Pango.Underline.NONE)
 
-        # Apply tag to all text
-        start_iter = self.text_buffer.get_start_iter()
-        end_iter = self.text_buffer.get_end_iter()
-        self.text_buffer.apply_tag(format_tag, start_iter, end_iter)
+        # Apply tag to all text, unless it already covers the buffer
+        if self._format_tag_stale:
+            start_iter, end_iter = self.text_buffer.get_bounds()
+            self.text_buffer.apply_tag(format_tag, start_iter, end_iter)
 
+        self._last_text_fmt = text_fmt
+        self._format_tag_stale = False
+
+    def _apply_margin_formatting(self, formatting):
+        """Apply the paragraph indentation to the text view"""
         # Apply margins - protegendo o recuo padrão da Citação ABNT
         left_margin = 4.0 if self.paragraph.type == ParagraphType.QUOTE else formatting.get('indent_left', 0.0)
         right_margin = formatting.get('indent_right', 0.0)
-        
-        self.text_view.set_left_margin(int(left_margin * 28))
-        self.text_view.set_right_margin(int(right_margin * 28))
+        margins = (int(left_margin * 28), int(right_margin * 28))
+        if margins == self._last_margins:
+            return
+
+        self.text_view.set_left_margin(margins[0])
+        self.text_view.set_right_margin(margins[1])
+        self._last_margins = margins
 
     def _update_word_count(self):
         """Update word count display"""
-         # Check if label already exist before use it
-        if not hasattr(self, 'word_count_label') or self.word_count_label is None:
+        # Most keystrokes don't change the count; skip the relayout then
+        if self.word_count_label is None or self._word_count == self._shown_word_count:
             return
-        word_count = TextHelper.count_words(self.paragraph.content)
-        self.word_count_label.set_text(_("{count} palavras").format(count=word_count))
+        self.word_count_label.set_text(_("{count} palavras").format(count=self._word_count))
+        self._shown_word_count = self._word_count
+
+    def get_plain_text(self) -> str:
+        """Get the buffer text without formatting tags"""
+        start_iter, end_iter = self.text_buffer.get_bounds()
+        return self.text_buffer.get_text(start_iter, end_iter, False)
+
+    def _get_boundary_chars(self, start_iter, end_iter):
+        """Get the characters right before start_iter and right at end_iter"""
+        before = ''
+        if not start_iter.is_start():
+            prev_iter = start_iter.copy()
+            prev_iter.backward_char()
+            before = prev_iter.get_char()
+        after = '' if end_iter.is_end() else end_iter.get_char()
+        return before, after
+
+    def _on_insert_text(self, buffer, location, text, length):
+        """Adjust the word count by the words the inserted text creates"""
+        # New text does not carry the base format tag yet
+        self._format_tag_stale = True
+        before, after = self._get_boundary_chars(location, location)
+        self._word_count += (TextHelper.count_words(before + text + after)
+                             - TextHelper.count_words(before + after))
+
+    def _on_delete_range(self, buffer, start_iter, end_iter):
+        """Adjust the word count by the words the deleted range removes"""
+        before, after = self._get_boundary_chars(start_iter, end_iter)
+        deleted = buffer.get_text(start_iter, end_iter, False)
+        self._word_count += (TextHelper.count_words(before + after)
+                             - TextHelper.count_words(before + deleted + after))
 
     def _on_text_changed(self, buffer):
         """Handle text changes"""
+        self._update_word_count()
+        self._queue_content_changed()
+
+    def _queue_content_changed(self):
+        """Serialize and notify once per burst of edits"""
+        if not self._flush_id:
+            self._flush_id = GLib.timeout_add(200, self._flush_edits)
+
+    def _flush_edits(self):
+        """Store the buffer content in the paragraph and notify listeners"""
+        self._flush_id = 0
+
         # Use method that capture formatting tags
         formatted_text = self._get_content_for_storage()
 
+        # Nothing to report; emitting would bump the edit revision and
+        # re-arm autosave, including from the flush autosave itself runs
+        if formatted_text == self.paragraph.content:
+            return False
+
         self.paragraph.update_content(formatted_text)
-        self._update_word_count()
         self.emit('content-changed')
+        return False
+
+    def flush_pending(self):
+        """Apply any pending text edits to the paragraph right away"""
+        if self._flush_id:
+            GLib.source_remove(self._flush_id)
+            self._flush_edits()
+
+    def cancel_pending(self, *args):
+        """Drop a pending flush, for an editor that is going away for good"""
+        if self._flush_id:
+            GLib.source_remove(self._flush_id)
+            self._flush_id = 0
 
     def _on_remove_clicked(self, button):
         """Handle remove button click"""
@@ -2164,6 +2583,8 @@ class ParagraphEditor(Gtk.Box):
     def _on_footnotes_updated(self, dialog):
         """Handle footnotes update"""
         self._update_footnote_badge()
+        # The text may be unchanged, so the flush alone would not report this
+        self.flush_pending()
         self.emit('content-changed')
         
     def _update_footnote_badge(self):
@@ -2171,8 +2592,11 @@ class ParagraphEditor(Gtk.Box):
         if not self.footnote_badge:
             return
         
-        # Get footnote count
-        footnote_count = len(self.paragraph.footnotes) if hasattr(self.paragraph, 'footnotes') and self.paragraph.footnotes else 0
+        # Get footnote count; text, opacity and tooltip all follow from it
+        footnote_count = len(self.paragraph.footnotes)
+        if footnote_count == self._badge_count:
+            return
+        self._badge_count = footnote_count
         
         if footnote_count > 0:
             # Show badge with count
@@ -2205,7 +2629,15 @@ class TextEditor(Gtk.Box):
         self.config = config
         
         self.spell_checker = None
-        self.spell_helper = SpellCheckHelper(config) if config else None
+        # Created in _setup_spell_check_delayed, only if spell check is enabled
+        self.spell_helper = None
+
+        # Buffer text as of the last get_text(), dropped on every change
+        self._text_cache = None
+        # Pending content-changed emission, coalescing bursts of edits
+        self._flush_id = 0
+        # Non-zero while set_text replaces the buffer on the caller's behalf
+        self._suppress_changed = 0
 
         self.text_buffer = Gtk.TextBuffer()
         self.text_buffer.set_text(initial_text)
@@ -2227,36 +2659,58 @@ class TextEditor(Gtk.Box):
 
     def _setup_spell_check_delayed(self):
         """Setup spell checking after widget is realized"""
-        if not self.spell_helper or not self.text_view:
+        if not self.config or not self.text_view:
             return False
         
-        if self.config and self.config.get_spell_check_enabled():
+        if self.config.get_spell_check_enabled():
             try:
+                if self.spell_helper is None:
+                    self.spell_helper = SpellCheckHelper(self.config)
                 self.spell_checker = self.spell_helper.setup_spell_check(self.text_view)
             except Exception as e:
-                print(_("Erro ao configurar verificação ortográfica: {}").format(e))
+                logger.warning("Spell check setup failed: %s", e)
         
         return False
 
     def _on_text_changed(self, buffer):
         """Handle text buffer changes"""
-        # Using new serialization method
-        formatted_text = self._get_content_for_storage()
+        self._text_cache = None
+        # The caller of set_text already knows the new content
+        if self._suppress_changed:
+            return
+        if not self._flush_id:
+            self._flush_id = GLib.timeout_add(150, self._flush_text_changed)
 
-        self.paragraph.update_content(formatted_text)
-        self._update_word_count()
-        self.emit('content-changed')
-        
+    def _flush_text_changed(self):
+        """Notify listeners once per burst of edits"""
+        self._flush_id = 0
+
+        # Only materialize the buffer text when someone is listening
+        signal_id = GObject.signal_lookup('content-changed', TextEditor)
+        if GObject.signal_has_handler_pending(self, signal_id, 0, False):
+            self.emit('content-changed', self.get_text())
+        return False
+
+    def flush_pending(self):
+        """Emit a pending content-changed right away"""
+        if self._flush_id:
+            GLib.source_remove(self._flush_id)
+            self._flush_text_changed()
         
     def get_text(self) -> str:
         """Get current text content"""
-        start_iter = self.text_buffer.get_start_iter()
-        end_iter = self.text_buffer.get_end_iter()
-        return self.text_buffer.get_text(start_iter, end_iter, False)
+        if self._text_cache is None:
+            start_iter, end_iter = self.text_buffer.get_bounds()
+            self._text_cache = self.text_buffer.get_text(start_iter, end_iter, False)
+        return self._text_cache
 
     def set_text(self, text: str):
         """Set text content"""
-        self.text_buffer.set_text(text)
+        self._suppress_changed += 1
+        try:
+            self.text_buffer.set_text(text)
+        finally:
+            self._suppress_changed -= 1
 
         
 class FootnoteDialog(Adw.Window):
@@ -2277,9 +2731,11 @@ class FootnoteDialog(Adw.Window):
         
         self.paragraph = paragraph
         
-        # Initialize footnotes list if it doesn't exist
-        if not hasattr(self.paragraph, 'footnotes'):
-            self.paragraph.footnotes = []
+        # Rows in display order, mirroring the children of footnotes_box
+        self._footnote_rows = []
+        
+        # Other paragraphs can't change while this modal dialog is open
+        self._global_offset = self._calculate_global_footnote_offset()
         
         self._create_ui()
 
@@ -2343,36 +2799,24 @@ class FootnoteDialog(Adw.Window):
 
     def _load_footnotes(self):
         """Load existing footnotes"""
-        # Calculate global footnote offset based on previous paragraphs
-        global_offset = self._calculate_global_footnote_offset()
-        
         for i, footnote_text in enumerate(self.paragraph.footnotes):
-            self._add_footnote_row(footnote_text, global_offset + i)
+            self._add_footnote_row(footnote_text, self._global_offset + i)
 
     def _calculate_global_footnote_offset(self) -> int:
         """Calculate how many footnotes exist before this paragraph"""
-        if not hasattr(self, 'paragraph') or not hasattr(self.paragraph, 'id'):
+        # Find the project that contains this paragraph through the parent window
+        project = getattr(self.get_transient_for(), 'current_project', None)
+        if not project:
             return 0
-        
-        # Find the project that contains this paragraph
-        try:
-            # Try to get project from parent window
-            parent = self.get_transient_for()
-            if hasattr(parent, 'current_project') and parent.current_project:
-                project = parent.current_project
-                total_footnotes = 0
-                
-                for p in project.paragraphs:
-                    if p.id == self.paragraph.id:
-                        break
-                    if hasattr(p, 'footnotes') and p.footnotes:
-                        total_footnotes += len(p.footnotes)
-                
-                return total_footnotes
-        except Exception:
-            pass
-        
-        return 0
+
+        paragraph_id = self.paragraph.id
+        total_footnotes = 0
+        for p in project.paragraphs:
+            if p.id == paragraph_id:
+                break
+            total_footnotes += len(p.footnotes)
+
+        return total_footnotes
 
     def _add_footnote_row(self, text="", index=None):
         """Add a footnote row"""
@@ -2382,18 +2826,11 @@ class FootnoteDialog(Adw.Window):
         # Number label
         num_label = Gtk.Label()
         
-        # Count current children correctly
         if index is not None:
             num_label.set_text(f"{index + 1}.")
         else:
-            # Calculate global offset + current children count
-            global_offset = self._calculate_global_footnote_offset()
-            child_count = 0
-            child = self.footnotes_box.get_first_child()
-            while child:
-                child_count += 1
-                child = child.get_next_sibling()
-            num_label.set_text(f"{global_offset + child_count + 1}.")
+            # Global offset + current row count
+            num_label.set_text(f"{self._global_offset + len(self._footnote_rows) + 1}.")
         
         num_label.set_halign(Gtk.Align.START)
         num_label.set_size_request(30, -1)
@@ -2410,60 +2847,82 @@ class FootnoteDialog(Adw.Window):
         remove_button = Gtk.Button()
         remove_button.set_icon_name('tac-edit-delete-symbolic')
         remove_button.add_css_class("flat")
-        remove_button.connect('clicked', lambda btn: self._remove_footnote_row(row_box))
+        remove_button.connect('clicked', self._on_remove_row_clicked)
         row_box.append(remove_button)
 
+        row_box._num_label = num_label
+        row_box._entry = entry
+        self._footnote_rows.append(row_box)
         self.footnotes_box.append(row_box)
 
     def _on_add_footnote(self, button):
         """Add a new footnote"""
         self._add_footnote_row()
 
+    def _on_remove_row_clicked(self, button):
+        """Remove the footnote row holding this button"""
+        self._remove_footnote_row(button.get_parent())
+
     def _remove_footnote_row(self, row_box):
         """Remove a footnote row"""
+        position = self._footnote_rows.index(row_box)
+        del self._footnote_rows[position]
         self.footnotes_box.remove(row_box)
-        self._renumber_footnotes()
-
-    def _renumber_footnotes(self):
-        """Renumber footnote labels"""
-        global_offset = self._calculate_global_footnote_offset()
-        child = self.footnotes_box.get_first_child()
-        index = 1
-        while child:
-            # Get the first child (number label)
-            label = child.get_first_child()
-            if isinstance(label, Gtk.Label):
-                label.set_text(f"{global_offset + index}.")
-            child = child.get_next_sibling()
-            index += 1
+        self._renumber_footnotes(position)
+
+    def _renumber_footnotes(self, start=0):
+        """Renumber footnote labels from the row at start onwards"""
+        # Rows before start keep their numbers
+        first_number = self._global_offset + start + 1
+        for number, row_box in enumerate(self._footnote_rows[start:], start=first_number):
+            row_box._num_label.set_text(f"{number}.")
 
     def _on_save_clicked(self, button):
         """Save footnotes"""
         footnotes = []
         
-        child = self.footnotes_box.get_first_child()
-        while child:
-            # Get the entry (second child)
-            entry_child = child.get_first_child().get_next_sibling()
-            if isinstance(entry_child, Gtk.Entry):
-                text = entry_child.get_text().strip()
-                if text:  # Only add non-empty footnotes
-                    footnotes.append(text)
-            child = child.get_next_sibling()
+        for row_box in self._footnote_rows:
+            text = row_box._entry.get_text().strip()
+            if text:  # Only add non-empty footnotes
+                footnotes.append(text)
 
         self.paragraph.footnotes = footnotes
         self.emit('footnotes-updated')
         self.destroy()
 
 
+_TOUR_CSS = """
+    /* Dark overlay that covers everything - 50% opacity to see interface */
+    .dark-overlay {
+        background-color: #000000;
+        opacity: 0.5;
+    }
+
+    /* Tour popover stays visible and bright */
+    popover.tour-popover {
+        opacity: 1.0;
+    }
+"""
+
+
 class FirstRunTour:
     """Interactive tour for first-time users with multiple steps"""
 
+    # The tour CSS is installed on the display by the first tour only
+    _css_installed = False
+
     def __init__(self, main_window, config):
         self.main_window = main_window
         self.config = config
         self.current_step = 0
         self.popover = None
+        self.step_stack = None
+
+        # Reused by _get_widget_rect; set_pointing_to copies the rectangle.
+        # Graphene is only needed here, so it is imported with the tour
+        from gi.repository import Graphene
+        self._origin = Graphene.Point().init(0, 0)
+        self._rect = Gdk.Rectangle()
 
         # Define tour steps with target widget and message
         self.steps = [
@@ -2535,71 +2994,96 @@ class FirstRunTour:
             },
         ]
 
-        # Add CSS for overlay
-        self._setup_css()
+        # Target widgets are fixed for the lifetime of the main window
+        self._target_cache = {
+            step['target']: getattr(self.main_window, step['target'], None)
+            for step in self.steps
+        }
 
     def _setup_css(self):
         """Setup CSS for tour overlay"""
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data("""
-            /* Dark overlay that covers everything - 50% opacity to see interface */
-            .dark-overlay {
-                background-color: rgba(0, 0, 0, 0.5);
-            }
-
-            /* Popover stays visible and bright */
-            popover {
-                opacity: 1.0;
-            }
-        """, -1)
+        if FirstRunTour._css_installed:
+            return
 
         display = Gdk.Display.get_default()
+        if not display:
+            return
+
+        css_provider = Gtk.CssProvider()
+        css_provider.load_from_data(_TOUR_CSS, -1)
         Gtk.StyleContext.add_provider_for_display(
             display,
             css_provider,
             Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
         )
+        FirstRunTour._css_installed = True
 
     def start(self):
         """Start the tour by showing first step"""
+        # Add CSS for overlay
+        self._setup_css()
+
         # Simply show the dark overlay (already created in main_window)
         if hasattr(self.main_window, 'tour_dark_overlay'):
             self.main_window.tour_dark_overlay.set_visible(True)
 
-        # Show first step
-        GLib.timeout_add(100, lambda: self.show_step(0))
+        # Show first step on the next main loop iteration (show_step returns None,
+        # so the idle source is removed after one run)
+        GLib.idle_add(self.show_step, 0)
 
     def show_step(self, step_index):
         """Show a specific step of the tour"""
-        if step_index < 0 or step_index >= len(self.steps):
+        # Skip ahead past steps whose target widget is not available
+        step_index = self._next_valid_step(step_index)
+        if step_index < 0:
             self.end_tour()
             return
 
         self.current_step = step_index
         step = self.steps[step_index]
-
-        # Close previous popover if exists
-        if self.popover:
-            self.popover.popdown()
-            self.popover.unparent()
-            self.popover = None
-
-        # Get target widget
         target_widget = self._get_target_widget(step['target'])
 
-        if not target_widget:
-            # Skip to next step if target not found
-            self.show_step(step_index + 1)
-            return
+        # Build the popover and all step pages once, then only switch pages
+        if self.popover is None:
+            self._build_popover()
 
-        # Create new popover
-        self.popover = Gtk.Popover()
+        # The popover stays parented to the window and just points at the
+        # target, which works the same for enabled and disabled widgets
         self.popover.set_position(step['position'])
+        self.step_stack.set_visible_child_name(str(step_index))
+        self.popover.set_pointing_to(self._get_widget_rect(target_widget))
+
+        if not self.popover.get_visible():
+            self.popover.popup()
+
+    def _next_valid_step(self, start):
+        """Get the first step from start on that has a target widget, or -1"""
+        if start < 0:
+            return -1
+        for step_index in range(start, len(self.steps)):
+            if self._get_target_widget(self.steps[step_index]['target']):
+                return step_index
+        return -1
+
+    def _build_popover(self):
+        """Create the tour popover with one stack page per step"""
+        self.popover = Gtk.Popover()
         self.popover.set_autohide(False)  # Don't close when clicking outside
         self.popover.set_has_arrow(True)
         self.popover.add_css_class('tour-popover')
 
-        # Create content
+        # Size the popover to the current page, not the largest one
+        self.step_stack = Gtk.Stack()
+        self.step_stack.set_hhomogeneous(False)
+        self.step_stack.set_vhomogeneous(False)
+        for step_index, step in enumerate(self.steps):
+            self.step_stack.add_named(self._build_step_page(step_index, step), str(step_index))
+
+        self.popover.set_child(self.step_stack)
+        self.popover.set_parent(self.main_window)
+
+    def _build_step_page(self, step_index, step):
+        """Create the content of a single tour step"""
         content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
         content_box.set_margin_top(20)
         content_box.set_margin_bottom(20)
@@ -2608,7 +3092,9 @@ class FirstRunTour:
 
         # Title
         title_label = Gtk.Label()
-        title_label.set_markup(f"<span size='large' weight='bold'>{step['title']}</span>")
+        title_label.set_markup(
+            f"<span size='large' weight='bold'>{GLib.markup_escape_text(step['title'])}</span>"
+        )
         title_label.set_wrap(True)
         title_label.set_max_width_chars(35)
         title_label.set_justify(Gtk.Justification.CENTER)
@@ -2637,40 +3123,37 @@ class FirstRunTour:
         # Skip button (only on first step)
         if step_index == 0:
             skip_button = Gtk.Button.new_with_label(_("Pular Tour"))
-            skip_button.connect('clicked', lambda b: self.end_tour())
+            skip_button.connect('clicked', self._on_end_clicked)
             buttons_box.append(skip_button)
 
         # Previous button (if not first step)
         if step_index > 0:
             prev_button = Gtk.Button.new_with_label(_("Anterior"))
-            prev_button.connect('clicked', lambda b: self.show_step(step_index - 1))
+            prev_button.connect('clicked', self._on_step_clicked, step_index - 1)
             buttons_box.append(prev_button)
 
         # Next/Finish button
         if step_index < len(self.steps) - 1:
             next_button = Gtk.Button.new_with_label(_("Próximo"))
             next_button.add_css_class("suggested-action")
-            next_button.connect('clicked', lambda b: self.show_step(step_index + 1))
+            next_button.connect('clicked', self._on_step_clicked, step_index + 1)
         else:
             next_button = Gtk.Button.new_with_label(_("Concluir"))
             next_button.add_css_class("suggested-action")
-            next_button.connect('clicked', lambda b: self.end_tour())
+            next_button.connect('clicked', self._on_end_clicked)
 
         buttons_box.append(next_button)
         content_box.append(buttons_box)
 
-        self.popover.set_child(content_box)
+        return content_box
 
-        # If target widget is disabled, use window as parent
-        if target_widget.get_sensitive():
-            # Widget is enabled - use it as parent (normal behavior)
-            self.popover.set_parent(target_widget)
-        else:
-            # Widget is DISABLED - use main window as parent
-            self.popover.set_parent(self.main_window)
-            self.popover.set_pointing_to(self._get_widget_rect(target_widget))
+    def _on_step_clicked(self, button, step_index):
+        """Handle Previous/Next buttons"""
+        self.show_step(step_index)
 
-        self.popover.popup()
+    def _on_end_clicked(self, button):
+        """Handle Skip/Finish buttons"""
+        self.end_tour()
 
     def _get_widget_rect(self, widget):
         """Get the rectangle position of a widget relative to window"""
@@ -2679,11 +3162,11 @@ class FirstRunTour:
         height = widget.get_height()
 
         # Get widget position relative to window
-        result = widget.compute_point(self.main_window, Graphene.Point().init(0, 0))
+        result = widget.compute_point(self.main_window, self._origin)
 
+        rect = self._rect
         if result and result[0]:  # Check if successful
             point = result[1]
-            rect = Gdk.Rectangle()
             rect.x = int(point.x)
             rect.y = int(point.y)
             rect.width = width
@@ -2691,7 +3174,6 @@ class FirstRunTour:
             return rect
 
         # Fallback - use approximate position
-        rect = Gdk.Rectangle()
         rect.x = 100
         rect.y = 100
         rect.width = width if width > 0 else 100
@@ -2700,9 +3182,7 @@ class FirstRunTour:
 
     def _get_target_widget(self, target_name):
         """Get widget by name from main window"""
-        if hasattr(self.main_window, target_name):
-            return getattr(self.main_window, target_name)
-        return None
+        return self._target_cache.get(target_name)
 
     def end_tour(self):
         """End the tour and restore normal UI"""
@@ -2716,9 +3196,26 @@ class FirstRunTour:
         if hasattr(self.main_window, 'tour_dark_overlay'):
             self.main_window.tour_dark_overlay.set_visible(False)
 
-        # Save config to not show tour again
-        self.config.set('show_first_run_tutorial', False)
+        # Save config to not show tour again, after the popover teardown
+        if self.config.get('show_first_run_tutorial', True):
+            self.config.set('show_first_run_tutorial', False)
+            GLib.idle_add(self._save_config, priority=GLib.PRIORITY_LOW)
+
+    def _save_config(self):
+        """Write the tour flag to disk"""
         self.config.save()
+        return GLib.SOURCE_REMOVE
+
+
+_LANDING_PAD_CSS = """
+.drop-landing-pad {
+    background-color: alpha(@accent_color, 0.1);
+    border: 2px dashed @accent_color;
+    border-radius: 6px;
+    margin: 4px 12px;
+}
+"""
+
 
 class ReorderableParagraphRow(Gtk.Box):
     """
@@ -2732,6 +3229,9 @@ class ReorderableParagraphRow(Gtk.Box):
         'paragraph-reorder': (GObject.SIGNAL_RUN_FIRST, None, (str, str, str)),
     }
 
+    # The landing pad stylesheet is shared by every row, so it goes on the display once
+    _css_installed = False
+
     def __init__(self, editor_widget, **kwargs):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, **kwargs)
         self.editor = editor_widget
@@ -2759,28 +3259,35 @@ class ReorderableParagraphRow(Gtk.Box):
         self.bottom_revealer.set_transition_duration(200)
         self.append(self.bottom_revealer)
 
+        # Reveal state of the pads, so motion events don't query the revealers
+        self._top_revealed = False
+        self._bottom_revealed = False
+
         # --- Controllers ---
         self._setup_drop_targets()
         self._setup_motion_controller()
         self._setup_css()
 
     def _setup_css(self):
-        # Style
-        css_provider = Gtk.CssProvider()
-        css = """
-        .drop-landing-pad {
-            background-color: alpha(@accent_color, 0.1);
-            border: 2px dashed @accent_color;
-            border-radius: 6px;
-            margin: 4px 12px;
-        }
-        """
+        """Setup CSS for the drop landing pads"""
+        if ReorderableParagraphRow._css_installed:
+            return
+
+        display = Gdk.Display.get_default()
+        if not display:
+            return
+
         try:
-            css_provider.load_from_data(css, -1)
-            display = Gdk.Display.get_default()
-            Gtk.StyleContext.add_provider_for_display(display, css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
-        except:
-            pass
+            css_provider = Gtk.CssProvider()
+            css_provider.load_from_data(_LANDING_PAD_CSS, -1)
+            Gtk.StyleContext.add_provider_for_display(
+                display,
+                css_provider,
+                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+            )
+            ReorderableParagraphRow._css_installed = True
+        except Exception as e:
+            logger.warning("Error loading drop landing pad styles: %s", e)
 
     def _setup_drop_targets(self):
         """Configura os DropTargets nos Pads (e não no widget principal)"""
@@ -2808,20 +3315,23 @@ class ReorderableParagraphRow(Gtk.Box):
         if _CURRENT_DRAG_ID == self.paragraph.id:
             return
 
-        height = self.get_height()
-        is_top_half = y < (height / 2)
+        is_top_half = y * 2 < self.get_height()
 
         # Planify logic:
-        if self.top_revealer.get_reveal_child() != is_top_half:
-            self.top_revealer.set_reveal_child(is_top_half)
-            
-        if self.bottom_revealer.get_reveal_child() != (not is_top_half):
-            self.bottom_revealer.set_reveal_child(not is_top_half)
+        self._set_pads_revealed(is_top_half, not is_top_half)
 
     def _on_hover_leave(self, controller):
         """Fecha tudo ao sair"""
-        self.top_revealer.set_reveal_child(False)
-        self.bottom_revealer.set_reveal_child(False)
+        self._set_pads_revealed(False, False)
+
+    def _set_pads_revealed(self, top, bottom):
+        """Open or close the landing pads, touching only the ones that change"""
+        if top != self._top_revealed:
+            self.top_revealer.set_reveal_child(top)
+            self._top_revealed = top
+        if bottom != self._bottom_revealed:
+            self.bottom_revealer.set_reveal_child(bottom)
+            self._bottom_revealed = bottom
 
     def _on_drop_top(self, target, value, x, y):
         return self._handle_drop("before")
@@ -77,6 +77,9 @@ class MainWindow(Adw.ApplicationWindow):
         # Auto-save timer tracking
         self.auto_save_timeout_id = None
         self.auto_save_pending = False
+        # Paragraph edit counter and its value at the last successful save
+        self._edit_revision = 0
+        self._saved_revision = 0
 
         # UI components
         self.header_bar = None
@@ -447,7 +450,9 @@ class MainWindow(Adw.ApplicationWindow):
             self.welcome_view.connect('create-project', self._on_create_project_from_welcome)
             self.welcome_view.connect('open-project', self._on_open_project_from_welcome)
 
-        self.main_stack.add_named(self.welcome_view, "welcome")
+        # The view is built once; only add it to the stack the first time
+        if self.main_stack.get_child_by_name("welcome") is None:
+            self.main_stack.add_named(self.welcome_view, "welcome")
         self.main_stack.set_visible_child_name("welcome")
         self._update_header_for_view("welcome")
 
@@ -663,6 +668,10 @@ class MainWindow(Adw.ApplicationWindow):
     
         for paragraph_id, widget in list(existing_widgets.items()):
             if paragraph_id not in current_paragraph_ids:
+                # A pending flush would write into a paragraph that is gone
+                editor = getattr(widget, 'editor', None)
+                if isinstance(editor, ParagraphEditor):
+                    editor.cancel_pending()
                 self.paragraphs_box.remove(widget)
                 del existing_widgets[paragraph_id]
     
@@ -1125,12 +1134,14 @@ class MainWindow(Adw.ApplicationWindow):
             current_stats = self.current_project.get_statistics()
             self.project_list.update_project_statistics(self.current_project.id, current_stats)
             
-            # Schedule auto-save if enabled
-            self._schedule_auto_save()
+            # Record the edit and schedule auto-save if enabled
+            self._mark_dirty()
 
     def _on_paragraph_remove_requested(self, paragraph_editor, paragraph_id):
         """Handle paragraph removal request"""
         if self.current_project:
+            # The save below must see what was typed in the last flush interval
+            self._flush_paragraph_edits()
             removed = self.current_project.remove_paragraph(paragraph_id)
             if removed:
                 self.project_manager.save_project(self.current_project)
@@ -1149,6 +1160,10 @@ class MainWindow(Adw.ApplicationWindow):
         if not paragraph:
             return
  
+        # The replacement editor is built from paragraph.content, so pending
+        # edits must reach the model first
+        self._flush_paragraph_edits()
+ 
         new_type = ParagraphType(new_type_str)
         if not paragraph.change_type(new_type):
             self._show_toast(
@@ -1222,6 +1237,7 @@ class MainWindow(Adw.ApplicationWindow):
 
         # Move no backend
         self.current_project.move_paragraph(dragged_id, new_idx)
+        self._mark_dirty()
         
         # 2. Update the Interface
         dragged_widget = self._existing_widgets.get(dragged_id)
@@ -1245,8 +1261,17 @@ class MainWindow(Adw.ApplicationWindow):
             # Fallback if something goes wrong
             self._refresh_paragraphs()
 
+    def _flush_paragraph_edits(self):
+        """Push pending text edits from the paragraph editors into the project"""
+        for row_widget in getattr(self, '_existing_widgets', {}).values():
+            editor = getattr(row_widget, 'editor', None)
+            if isinstance(editor, ParagraphEditor):
+                editor.flush_pending()
+
     def _on_close_request(self, window):
         """Handle window close request"""
+        self._flush_paragraph_edits()
+
         # Cancel any pending auto-save timer
         if self.auto_save_timeout_id is not None:
             GLib.source_remove(self.auto_save_timeout_id)
@@ -2049,8 +2074,11 @@ class MainWindow(Adw.ApplicationWindow):
         if not self.current_project:
             return False
 
+        self._flush_paragraph_edits()
+        revision = self._edit_revision
         success = self.project_manager.save_project(self.current_project)
         if success:
+            self._saved_revision = revision
             self._show_toast(_("Projeto salvo com sucesso"))
             self.project_list.refresh_projects()
             self.config.add_recent_project(self.current_project.id)
@@ -2059,6 +2087,11 @@ class MainWindow(Adw.ApplicationWindow):
 
         return success
     
+    def _mark_dirty(self):
+        """Record an unsaved change to the project and schedule an auto-save"""
+        self._edit_revision += 1
+        self._schedule_auto_save()
+
     def _schedule_auto_save(self):
         """Schedule an auto-save operation after a delay"""
         # Check if auto-save is enabled
@@ -2090,10 +2123,17 @@ class MainWindow(Adw.ApplicationWindow):
         if not self.current_project:
             return False  # Don't repeat timeout
         
+        # Skip the save (and its backup) if nothing was edited since the last one
+        self._flush_paragraph_edits()
+        revision = self._edit_revision
+        if revision == self._saved_revision:
+            return False
+        
         # Perform save (this will trigger backup creation)
         success = self.project_manager.save_project(self.current_project)
         
         if success:
+            self._saved_revision = revision
             # Silent save - no toast for auto-save to avoid interrupting user
             self.project_list.refresh_projects()
             self.config.add_recent_project(self.current_project.id)
@@ -2112,6 +2152,7 @@ class MainWindow(Adw.ApplicationWindow):
             self._show_toast(_("Nenhum projeto para exportar"), Adw.ToastPriority.HIGH)
             return
 
+        self._flush_paragraph_edits()
         dialog = ExportDialog(self, self.current_project, self.export_service)
         dialog.present()
 
@@ -2185,6 +2226,7 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _load_project(self, project_id: str):
         """Load a project by ID"""
+        self._flush_paragraph_edits()
         self._show_loading_state()
 
         try:
@@ -2206,6 +2248,7 @@ class MainWindow(Adw.ApplicationWindow):
                 position = self.current_project.paragraphs.index(ref_paragraph) + 1
  
         paragraph = self.current_project.add_paragraph(paragraph_type, position=position)
+        self._mark_dirty()
  
         paragraph_editor = ParagraphEditor(paragraph, config=self.config)
         paragraph_editor.connect('content-changed', self._on_paragraph_changed)